@@ -0,0 +1,366 @@
+# -*- coding: utf_8 -*-
+
+"""
+Grammar used for the purposes of the assignment, with the scanner and
+the parse tables that parser.py and runner.py share.
+
+Stmt_list -> Stmt Stmt_list | ε .
+Stmt -> id : Expr | print Expr.
+Expr -> Term Term_tail.
+Term_tail -> Xorop Term Term_tail | ε .
+Term -> Factor Factor_tail.
+Factor_tail -> Orop Factor Factor_tail | ε .
+Factor -> Operand Operand_tail.
+Operand_tail -> Andop Operand Operand_tail | ε .
+Operand -> ( Expr ) | id | binary.
+Xorop -> xor.
+Orop -> or.
+Andop -> and.
+
+FIRST sets
+----------
+Stmt_list: id print ε
+Stmt: id print
+Term_tail:  xor ε
+Term: id binary
+Factor_tail: or ε
+Factor: ( id binary
+Operand_tail: and ε
+Operand: ( id binary
+Expr: ( id binary
+Xorop: xor
+Orop: or
+Andop: and
+
+FOLLOW sets
+-----------
+Stmt_list:
+Stmt: id print
+Term_tail: ) id print
+Term: ) xor id print
+Factor_tail: ) xor id print
+Factor: ) or xor id print
+Operand_tail: ) or xor id print
+Operand: ) and or xor id print
+Expr: ) id print
+Xorop: ( id binary
+Orop: ( id binary
+Andop: ( id binary
+"""
+
+
+import re
+import sys
+
+
+# token types, interned so that the parser can compare them by identity
+ID = sys.intern('id')
+BIN = sys.intern('binary')
+PRINT = sys.intern('print')
+XOR = sys.intern('xor')
+OR = sys.intern('or')
+AND = sys.intern('and')
+EQ = sys.intern('=')
+LP = sys.intern('(')
+RP = sys.intern(')')
+
+# FIRST sets used by the parse methods
+FIRST_STMT = frozenset((ID, PRINT))
+FIRST_EXPR = frozenset((ID, BIN, LP))
+
+# one bit per token type (None stands for end of input), so that FOLLOW set
+# membership is a single integer and against the masks below
+TOKEN_BITS = {
+    None: 1, ID: 2, PRINT: 4, BIN: 8, LP: 16, RP: 32,
+    XOR: 64, OR: 128, AND: 256, EQ: 512
+}
+FOLLOW_EXPR = TOKEN_BITS[None] | TOKEN_BITS[RP] | TOKEN_BITS[ID] | TOKEN_BITS[PRINT]
+FOLLOW_TERM = FOLLOW_EXPR | TOKEN_BITS[XOR]
+FOLLOW_FACTOR = FOLLOW_TERM | TOKEN_BITS[OR]
+
+# the scanner lexicon as a single alternation, tried in order at each position;
+# names are split into keywords and ids after matching, so that e.g. 'xor1'
+# is scanned as one id (longest match) rather than as 'xor' followed by '1'
+_TOKEN_RE = re.compile(r"""
+    (?P<binary>[01]+)
+  | (?P<name>[A-Za-z][A-Za-z0-9]*)
+  | (?P<punct>[=()])
+  | (?P<skip>[ \t\n]+ | \{[^}]*\})
+  | (?P<error>.)
+""", re.VERBOSE | re.DOTALL)
+_OPERATORS = frozenset((XOR, OR, AND))
+
+# token type of the entry that marks unscannable input
+ERROR = sys.intern('error')
+
+
+def _tokenize(text):
+    """ Scans the whole of text into parallel lists of token types,
+    matched texts and start offsets, ending with a (None, None) entry.
+    Scanning stops at the first character no pattern matches, which is
+    stored as an ERROR entry and only reported when the parser reaches it. """
+
+    tags = []
+    vals = []
+    starts = []
+    for m in _TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == 'skip':
+            continue
+        value = m.group()
+        if kind == 'binary':
+            tag = BIN
+        elif kind == 'name':
+            # ids are interned too, so symbol table lookups compare by identity
+            value = tag = sys.intern(value)
+            if tag not in _OPERATORS and value.lower() != PRINT:
+                tag = ID
+        elif kind == 'punct':
+            tag = sys.intern(value)
+        else:
+            tags.append(ERROR)
+            vals.append(value)
+            starts.append(m.start())
+            return tags, vals, starts
+        tags.append(tag)
+        vals.append(value)
+        starts.append(m.start())
+
+    tags.append(None)
+    vals.append(None)
+    starts.append(len(text))
+    return tags, vals, starts
+
+
+class ScanError(Exception):
+    """ A user defined exception class, to describe scanner errors. """
+    pass
+
+
+class ParseError(Exception):
+    """ A user defined exception class, to describe parse errors. """
+    pass
+
+
+class Scanner:
+    """ The tokens of a whole input text, kept as parallel lists of
+    token types (tags), matched texts (vals) and start offsets (starts). """
+
+    def __init__(self, text):
+        self.text = text
+        self.tags, self.vals, self.starts = _tokenize(text)
+
+    def position(self, i):
+        """ Returns (name, line, char) of token i,
+        with a 1-based line and a 0-based char. """
+
+        pos = self.starts[i]
+        line = self.text.count('\n', 0, pos) + 1
+        char = pos - (self.text.rfind('\n', 0, pos) + 1)
+        return None, line, char
+
+
+def make_scanner(fp):
+    """ Creates a scanner for the grammar over the contents of file object fp. """
+
+    return Scanner(fp.read())
+
+
+class Recognizer:
+    """ A class encapsulating all parsing functionality for the grammar.
+    On its own it only checks the input; subclasses that generate code
+    override the operand leaves (_operand_id, _operand_bin) and the
+    emit_* hooks called after each operator and at each statement end. """
+
+    def __init__(self):
+        # lookahead -> handler tables for the alternatives of Stmt and for the
+        # leaf alternatives of Operand
+        self._stmt_dispatch = {
+            ID: self._parse_id_stmt,
+            PRINT: self._parse_print_stmt
+        }
+        self._operand_dispatch = {
+            ID: self._operand_id,
+            BIN: self._operand_bin
+        }
+
+    def create_scanner(self, fp):
+        """ Creates a scanner for a particular grammar
+        to operate on file object fp. """
+
+        # the whole input is tokenized up front into parallel lists (token
+        # types, texts and offsets), the parser then walks a cursor over them;
+        # the parse decisions only ever touch the token types in self._tags
+        self.scanner = make_scanner(fp)
+        self._tags = self.scanner.tags
+        self._vals = self.scanner.vals
+
+        # get initial lookahead
+        self._i = 0
+        self.la = self._tags[0]
+
+    def position(self):
+        """ Utility function that returns position in text in case of errors.
+        Here it simply returns the scanner position of the current token. """
+
+        return self.scanner.position(self._i)
+
+    def match(self, token):
+        """ Consumes (matches with current lookahead) an expected token.
+        Raises ParseError if anything else is found. Acquires new lookahead. """
+
+        if self.la is token:
+            self._i += 1
+            self.la = self._tags[self._i]
+        else:
+            raise ParseError("found {} instead of {}".format(self.la, token))
+
+    def parse(self, fp):
+        """ Creates scanner for input file object fp and calls the parse logic code. """
+
+        # create the scanner for fp
+        self.create_scanner(fp)
+
+        try:
+            self.stmt_list()
+        except ParseError:
+            # any parse method fails on the ERROR lookahead, report it as such
+            if self.la is ERROR:
+                raise ScanError("unexpected character {!r}".format(self._vals[self._i])) from None
+            raise
+
+    def stmt_list(self):
+        '''Stmt_list -> { Stmt } .'''
+        stmt = self.stmt
+        while self.la in FIRST_STMT:
+            stmt()
+        if self.la is not None:
+            raise ParseError("in stmt_list: id or print expected")
+
+    def stmt(self):
+        '''Stmt -> id : Expr | print Expr.'''
+        fn = self._stmt_dispatch.get(self.la)
+        if fn is None:
+            raise ParseError("in stmt: id or print expected")
+        fn()
+
+    def _parse_id_stmt(self):
+        '''Stmt -> id = Expr.'''
+        symbol = self._vals[self._i]
+        self.match(ID)
+        self.match(EQ)
+        self.expr()
+        self.emit_store(symbol)
+
+    def _parse_print_stmt(self):
+        '''Stmt -> print Expr.'''
+        self.match(PRINT)
+        self.expr()
+        self.emit_print()
+
+    def expr(self):
+        '''Expr -> Term { Xorop Term } .'''
+        if self.la in FIRST_EXPR:
+            tags = self._tags
+            term = self.term
+            emit = self.emit_xor
+            term()
+            while self.la is XOR:
+                # the operator is already known, step over it without match()
+                self._i += 1
+                self.la = tags[self._i]
+                term()
+                emit()
+        else:
+            raise ParseError("in expr: id, binary or '(' expected")
+
+    def term(self):
+        '''Term -> Factor { Orop Factor } .'''
+        if self.la in FIRST_EXPR:
+            tags = self._tags
+            factor = self.factor
+            emit = self.emit_or
+            factor()
+            while self.la is OR:
+                self._i += 1
+                self.la = tags[self._i]
+                factor()
+                emit()
+        else:
+            raise ParseError("in term: id, binary or '(' expected")
+
+    def factor(self):
+        '''Factor -> Operand { Andop Operand } .'''
+        if self.la in FIRST_EXPR:
+            tags = self._tags
+            operand = self.operand
+            emit = self.emit_and
+            operand()
+            while self.la is AND:
+                self._i += 1
+                self.la = tags[self._i]
+                operand()
+                emit()
+            # this check covers Term and Expr too: what is left after their
+            # or/xor loops is always in their FOLLOW sets
+            if not TOKEN_BITS.get(self.la, 0) & FOLLOW_FACTOR:
+                raise ParseError("in factor: and expected")
+        else:
+            raise ParseError("in factor: id, binary or '(' expected")
+
+    def operand(self):
+        '''Operand -> ( Expr ) | id | binary.'''
+        if self.la is LP:
+            # parsed here rather than in a handler, so that nesting costs
+            # no extra frame per parenthesis level
+            self.match(LP)
+            self.expr()
+            self.match(RP)
+        else:
+            fn = self._operand_dispatch.get(self.la)
+            if fn is None:
+                raise ParseError("in operand: id, binary or '(' expected")
+            fn()
+
+    def _operand_id(self):
+        '''Operand -> id.'''
+        self.match(ID)
+
+    def _operand_bin(self):
+        '''Operand -> binary.'''
+        self.match(BIN)
+
+    # code generation hooks, no-ops for plain recognition
+
+    def emit_xor(self):
+        pass
+
+    def emit_or(self):
+        pass
+
+    def emit_and(self):
+        pass
+
+    def emit_store(self, symbol):
+        pass
+
+    def emit_print(self):
+        pass
+
+
+def parse_file(parser, filename):
+    """ Parses file filename with parser, printing any scanner or
+    parser error together with its position. """
+
+    # open file for parsing
+    with open(filename, "r") as fp:
+
+        # parse file
+        try:
+            parser.parse(fp)
+        except ScanError:
+            _, lineno, charno = parser.position()
+            print("Scanner Error: at line {} char {}".format(lineno, charno+1))
+        except ParseError as perr:
+            _, lineno, charno = parser.position()
+            print("Parser Error: {} at line {} char {}".format(perr, lineno, charno+1))
@@ -2,279 +2,160 @@
 # -*- coding: utf_8 -*-
 
 """
-Grammar used for the purposes of the assignment.
-
-Stmt_list -> Stmt Stmt_list | ε .
-Stmt -> id : Expr | print Expr.
-Expr -> Term Term_tail.
-Term_tail -> Xorop Term Term_tail | ε .
-Term -> Factor Factor_tail.
-Factor_tail -> Orop Factor Factor_tail | ε .
-Factor -> Operand Operand_tail.
-Operand_tail -> Andop Operand Operand_tail | ε .
-Operand -> ( Expr ) | id | binary.
-Xorop -> xor.
-Orop -> or.
-Andop -> and.
-
-FIRST sets
-----------
-Stmt_list: id print ε
-Stmt: id print
-Term_tail:  xor ε
-Term: id binary
-Factor_tail: or ε
-Factor: ( id binary
-Operand_tail: and ε
-Operand: ( id binary
-Expr: ( id binary
-Xorop: xor
-Orop: or
-Andop: and
-
-FOLLOW sets
------------
-Stmt_list:
-Stmt: id print
-Term_tail: ) id print
-Term: ) xor id print
-Factor_tail: ) xor id print
-Factor: ) or xor id print
-Operand_tail: ) or xor id print
-Operand: ) and or xor id print
-Expr: ) id print
-Xorop: ( id binary
-Orop: ( id binary
-Andop: ( id binary
+Interpreter for the grammar in grammar.py: compiles binary.txt to
+code for a small stack machine and runs it.
 """
 
 
-import plex
+import sys
 
+from grammar import BIN, ID, ParseError, Recognizer, ScanError, parse_file
 
-class ParseError(Exception):
-    """ A user defined exception class, to describe parse errors. """
-    pass
 
+# opcodes of the stack machine that programs are compiled to; PUSH_CONST,
+# PUSH_VAR and STORE are followed in the code list by their operand, which
+# for the latter two is the variable's slot number
+_OP_PUSH_CONST = 0
+_OP_PUSH_VAR = 1
+_OP_XOR = 2
+_OP_OR = 3
+_OP_AND = 4
+_OP_STORE = 5
+_OP_PRINT = 6
 
-class MyParser:
+
+class MyParser(Recognizer):
     """ A class encapsulating all parsing functionality
-    for a particular grammar. """
+    for a particular grammar. Programs are compiled to a flat
+    code list while parsing and then executed by run(). """
 
     def __init__(self):
-        self.st = {}
-
-    def create_scanner(self, fp):
-        """ Creates a plex scanner for a particular grammar
-        to operate on file object fp. """
-
-        # define some pattern constructs
-        letter = plex.Range("AZaz")
-        digit = plex.Range("09")
-        binary = plex.Rep1(plex.Any("01"))
-
-        id = letter + plex.Rep(letter | digit)
-        operator = plex.Str("and", "or", "xor", "=")
-        paren = plex.Any("()")
-        space = plex.Any(" \t\n")
-        comment = plex.Str("{") + plex.Rep(plex.AnyBut("}")) + plex.Str("}")
-        keyword = plex.NoCase(plex.Str("print"))
-
-        # the scanner lexicon - constructor argument is a list of (pattern,action ) tuples
-        lexicon = plex.Lexicon([
-            (binary, "binary"),
-            (operator, plex.TEXT),
-            (keyword, plex.TEXT),
-            (paren, plex.TEXT),
-            (space | comment, plex.IGNORE),
-            (id, 'id')
-        ])
-
-        # create and store the scanner object
-        self.scanner = plex.Scanner(lexicon, fp)
+        super().__init__()
 
-        # get initial lookahead
-        self.la, self.val = self.next_token()
-
-    def next_token(self):
-        """ Returns tuple (next_token,matched-text). """
-
-        return self.scanner.read()
-
-    def position(self):
-        """ Utility function that returns position in text in case of errors.
-        Here it simply returns the scanner position. """
-
-        return self.scanner.position()
-
-    def match(self, token):
-        """ Consumes (matches with current lookahead) an expected token.
-        Raises ParseError if anything else is found. Acquires new lookahead. """
-
-        if self.la == token:
-            token_eval = self.evaluate()
-            self.la, self.val = self.next_token()
-            return token_eval
-        else:
-            raise ParseError("found {} instead of {}".format(self.la, token))
-
-    def evaluate(self):
-        if self.la == 'binary':
-            return int(self.val, 2)
-        elif self.la == 'id':
-            return self.st.get(self.val, None)  # return None if self.val is not a key
-        else:
-            return self.val
+        # variables live in numbered slots, assigned on first sight at parse time
+        self._name2id = {}
+        self._names = []
+        self._vars = []
+        self._out = []  # lines printed by the program, written out by parse()
 
     def parse(self, fp):
-        """ Creates scanner for input file object fp and calls the parse logic code. """
-
-        # create the plex scanner for fp
-        self.create_scanner(fp)
-
-        self.stmt_list()
-
-    def stmt_list(self):
-        '''Stmt_list -> Stmt Stmt_list | ε .'''
-        if self.la == 'id' or self.la == 'print':
-            self.stmt()
-            self.stmt_list()
-        elif self.la is None:
-            return
-        else:
-            raise ParseError("in stmt_list: id or print expected")
-
-    def stmt(self):
-        '''Stmt -> id : Expr | print Expr.'''
-        if self.la == 'id':
-            symbol = self.val
-            self.match('id')
-            self.match('=')
-            self.st[symbol] = self.expr()
-        elif self.la == 'print':
-            self.match('print')
-            print('{:b}'.format(self.expr()))
-        else:
-            raise ParseError("in stmt: id or print expected")
-
-    def expr(self):
-        '''Expr -> Term Term_tail.'''
-        if self.la in ['id', 'binary', '(']:
-            a = self.term()
-            b = self.term_tail()
-            # print(a, b, sep=' xor ')
-            if b is not None:
-                for b_val in b[:-1]:
-                    a = a ^ b_val
-            # print('{:b}'.format(a))
-            return a
-        else:
-            raise ParseError("in expr: id, binary or '(' expected")
-
-    def term(self):
-        '''Term -> Factor Factor_tail.'''
-        if self.la in ['id', 'binary', '(']:
-            a = self.factor()
-            b = self.factor_tail()
-            # print(a, b, sep=' or ')
-
-            if b is not None:
-                for b_val in b[:-1]:
-                    a = a | b_val
-            # print('{:b}'.format(a))
-            return a
-        else:
-            raise ParseError("in term: id, binary or '(' expected")
-
-    def term_tail(self):
-        '''Term_tail -> Xorop Term Term_tail | ε .'''
-        if self.la == 'xor':
-            self.match('xor')
-            a = self.term()
-            b = self.term_tail()
-            # print(a, b, sep=' ^ ')
-            return (a, *b)
-        elif self.la is None or self.la in [')', 'id', 'print']:
-            return (None,)
-        else:
-            raise ParseError("in term_tail: xor expected")
-
-    def factor(self):
-        '''Factor -> Operand Operand_tail.'''
-        if self.la in ['id', 'binary', '(']:
-            a = self.operand()
-            b = self.operand_tail()
-            # print(a, b, sep=' and ')
-            if b is not None:
-                for b_val in b[:-1]:
-                    a = a & b_val
-            # print('{:b}'.format(a))
-            return a
-        else:
-            raise ParseError("in factor: id, binary or '(' expected")
-
-    def factor_tail(self):
-        '''Factor_tail -> Orop Factor Factor_tail | ε .'''
-        if self.la == 'or':
-            self.match('or')
-            a = self.factor()
-            b = self.factor_tail()
-            # print(a, b, sep=' | ')
-            return (a, *b)
-        elif self.la is None or self.la in [')', 'xor', 'id', 'print']:
-            return (None,)
-        else:
-            raise ParseError("in factor_tail: or expected")
-
-    def operand(self):
-        '''Operand -> ( Expr ) | id | binary.'''
-        if self.la == 'id':
-            var = self.val
-            a = self.match('id')
-            if a is None:
-                raise RuntimeError(f"variable '{var}' referenced before assignment")
-            return a
-            # print(a)
-        elif self.la == 'binary':
-            a = self.match('binary')
-            return a
-        elif self.la == '(':
-            self.match('(')
-            a = self.expr()
-            self.match(')')
-            return a
-        else:
-            raise ParseError("in operand: id, binary or '(' expected")
-
-    def operand_tail(self):
-        '''Operand_tail -> Andop Operand Operand_tail | ε .'''
-        if self.la == 'and':
-            self.match('and')
-            a = self.operand()
-            b = self.operand_tail()
-            # print(a, b, sep=' & ')
-            return (a, *b)
-        elif self.la is None or self.la in [')', 'xor', 'or', 'id', 'print']:
-            return (None,)
-        else:
-            raise ParseError("in operand_tail: or expected")
-
-
-# the main part of prog
-
-# create the parser object
-parser = MyParser()
-
-# open file for parsing
-with open("binary.txt", "r") as fp:
-
-    # parse file
-    try:
-        parser.parse(fp)
-    except plex.errors.PlexError:
-        _, lineno, charno = parser.position()
-        print("Scanner Error: at line {} char {}".format(lineno, charno+1))
-    except ParseError as perr:
-        _, lineno, charno = parser.position()
-        print("Parser Error: {} at line {} char {}".format(perr, lineno, charno+1))
-# print('Done!')
+        """ Creates scanner for input file object fp, compiles the program
+        and runs it. """
+
+        self._code = []
+        self._stmt_end = 0  # end of the code of the last complete statement
+
+        error = None
+        try:
+            super().parse(fp)
+        except (ScanError, ParseError) as err:
+            # the complete statements before a syntax error still run
+            error = err
+            del self._code[self._stmt_end:]
+
+        try:
+            # a runtime error here is the only error reported, the syntax
+            # error is raised only after the code before it ran cleanly
+            self.run(self._code)
+            if error is not None:
+                raise error
+        finally:
+            # write all printed lines with a single call, also when parsing fails
+            if self._out:
+                sys.stdout.write('\n'.join(self._out))
+                sys.stdout.write('\n')
+                self._out.clear()
+
+    def run(self, code):
+        """ Executes compiled code on a value stack.
+        Raises RuntimeError when a variable is read before it is assigned. """
+
+        slots = self._vars
+        out = self._out
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        end = len(code)
+        while pc < end:
+            op = code[pc]
+            pc += 1
+            if op == _OP_PUSH_VAR:
+                sid = code[pc]
+                pc += 1
+                a = slots[sid]
+                if a is None:
+                    name = self._names[sid]
+                    raise RuntimeError(f"variable '{name}' referenced before assignment")
+                push(a)
+            elif op == _OP_PUSH_CONST:
+                push(code[pc])
+                pc += 1
+            elif op == _OP_XOR:
+                b = pop()
+                stack[-1] ^= b
+            elif op == _OP_OR:
+                b = pop()
+                stack[-1] |= b
+            elif op == _OP_AND:
+                b = pop()
+                stack[-1] &= b
+            elif op == _OP_STORE:
+                slots[code[pc]] = pop()
+                pc += 1
+            elif op == _OP_PRINT:
+                out.append(bin(pop())[2:])
+            else:
+                raise RuntimeError("unknown opcode {} at {}".format(op, pc - 1))
+
+    def slot(self, name):
+        """ Returns the slot number of variable name, allocating one on first use. """
+
+        sid = self._name2id.get(name)
+        if sid is None:
+            sid = len(self._vars)
+            self._name2id[name] = sid
+            self._names.append(name)
+            self._vars.append(None)
+        return sid
+
+    def _operand_id(self):
+        '''Operand -> id.'''
+        self._code += (_OP_PUSH_VAR, self.slot(self._vals[self._i]))
+        self.match(ID)
+
+    def _operand_bin(self):
+        '''Operand -> binary.'''
+        self._code += (_OP_PUSH_CONST, int(self._vals[self._i], 2))
+        self.match(BIN)
+
+    def emit_xor(self):
+        self._code.append(_OP_XOR)
+
+    def emit_or(self):
+        self._code.append(_OP_OR)
+
+    def emit_and(self):
+        self._code.append(_OP_AND)
+
+    def emit_store(self, symbol):
+        self._code += (_OP_STORE, self.slot(symbol))
+        self._stmt_end = len(self._code)
+
+    def emit_print(self):
+        self._code.append(_OP_PRINT)
+        self._stmt_end = len(self._code)
+
+
+def main():
+    """ The main part of prog: parses binary.txt in the current directory. """
+
+    # create the parser object
+    parser = MyParser()
+
+    parse_file(parser, "binary.txt")
+    # print('Done!')
+
+
+if __name__ == "__main__":
+    main()